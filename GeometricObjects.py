@@ -2,87 +2,169 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import math
 
+# Constants hoisted out of the per-call formulas
+_SQRT3 = math.sqrt(3)
+_INV_6SQRT2 = 1.0 / (6.0 * math.sqrt(2))
+_4PI = 4 * math.pi
+_4PI_3 = (4/3) * math.pi
+
 ## ----------------------------------------------------
 ## 1. GEOMETRY CLASSES
 ## ----------------------------------------------------
 
 class Shape:
     """Base class for geometric shapes."""
+    # No per-instance __dict__: subclasses declare their attributes in __slots__
+    __slots__ = ()
     def surface(self):
         return 0
     def volume(self):
         return 0
     def get_params(self):
-        return {}
+        # Parameter values in SHAPE_MAP "params" order; zip with those names when labels are needed
+        return ()
     def __str__(self):
         return self.__class__.__name__
 
 #  2D Shapes 
 
 class Circle(Shape):
+    __slots__ = ('r',)
     def __init__(self, radius):
         if radius < 0: raise ValueError("Radius must be non-negative.")
         self.r = radius
     def surface(self):
-        return math.pi * self.r**2
+        r = self.r
+        return math.pi * r * r
+    @staticmethod
+    def surface_batch(r):
+        return math.pi * r * r
     def get_params(self):
-        return {"Radius": self.r}
+        return (self.r,)
 
 class Rectangle(Shape):
+    __slots__ = ('w', 'h')
     def __init__(self, width, height):
         if width < 0 or height < 0: raise ValueError("Dimensions must be non-negative.")
         self.w = width
         self.h = height
     def surface(self):
         return self.w * self.h
+    @staticmethod
+    def surface_batch(w, h):
+        return w * h
     def get_params(self):
-        return {"Width": self.w, "Height": self.h}
+        return (self.w, self.h)
 
 class Triangle(Shape):
+    __slots__ = ('b', 'h')
     def __init__(self, base, height):
         if base < 0 or height < 0: raise ValueError("Dimensions must be non-negative.")
         self.b = base
         self.h = height
     def surface(self):
         return 0.5 * self.b * self.h
+    @staticmethod
+    def surface_batch(b, h):
+        return 0.5 * b * h
     def get_params(self):
-        return {"Base": self.b, "Height": self.h}
+        return (self.b, self.h)
 
 #  3D Shapes 
 class Block(Shape):
+    __slots__ = ('l', 'w', 'h')
     def __init__(self, length, width, height):
         if length < 0 or width < 0 or height < 0: raise ValueError("Dimensions must be non-negative.")
         self.l = length
         self.w = width
         self.h = height
     def surface(self):
-        return 2 * (self.l * self.w + self.l * self.h + self.w * self.h)
+        l, w, h = self.l, self.w, self.h
+        return 2 * (l * (w + h) + w * h)
     def volume(self):
         return self.l * self.w * self.h
+    @staticmethod
+    def surface_batch(l, w, h):
+        return 2 * (l * (w + h) + w * h)
+    @staticmethod
+    def volume_batch(l, w, h):
+        return l * w * h
     def get_params(self):
-        return {"Length": self.l, "Width": self.w, "Height": self.h}
+        return (self.l, self.w, self.h)
 
 class Sphere(Shape):
+    __slots__ = ('r',)
     def __init__(self, radius):
         if radius < 0: raise ValueError("Radius must be non-negative.")
         self.r = radius
     def surface(self):
-        return 4 * math.pi * self.r**2
+        r = self.r
+        return _4PI * r * r
     def volume(self):
-        return (4/3) * math.pi * self.r**3
+        r = self.r
+        return _4PI_3 * r * r * r
+    @staticmethod
+    def surface_batch(r):
+        return _4PI * r * r
+    @staticmethod
+    def volume_batch(r):
+        return _4PI_3 * r * r * r
     def get_params(self):
-        return {"Radius": self.r}
+        return (self.r,)
 
 class Tetrahedron(Shape):
+    __slots__ = ('a',)
     def __init__(self, edge):
         if edge < 0: raise ValueError("Edge length must be non-negative.")
         self.a = edge
     def surface(self):
-        return math.sqrt(3) * self.a**2
+        return _SQRT3 * self.a * self.a
     def volume(self):
-        return self.a**3 / (6 * math.sqrt(2))
+        return self.a * self.a * self.a * _INV_6SQRT2
+    @staticmethod
+    def surface_batch(a):
+        return _SQRT3 * a * a
+    @staticmethod
+    def volume_batch(a):
+        return a * a * a * _INV_6SQRT2
     def get_params(self):
-        return {"Edge Length": self.a}
+        return (self.a,)
+
+#  Batch Computation 
+# The *_batch static methods take one NumPy array per parameter (structure of arrays)
+# and evaluate a single vectorized expression instead of one Python call per shape.
+
+def compute_many(shape_cls, param_matrix):
+    """Computes surfaces and volumes for many shapes of one class at once.
+
+    param_matrix has one row per shape and one column per constructor parameter
+    (in the order of SHAPE_MAP params). A flat sequence is read as one value per
+    shape for one-parameter shapes, and as a single shape otherwise. Returns a
+    (surfaces, volumes) pair of NumPy arrays; volumes are zero for 2D shapes.
+    """
+    import numpy as np  # Only the batch API needs NumPy
+
+    param_names = next((info["params"] for shapes in SHAPE_MAP.values()
+                        for info in shapes.values() if info["class"] is shape_cls), None)
+    if param_names is None: raise ValueError(f"Unknown shape class: {shape_cls!r}.")
+    n_params = len(param_names)
+
+    matrix = np.asarray(param_matrix, dtype=float)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(-1, n_params) if n_params == 1 or matrix.size == 0 else matrix.reshape(1, -1)
+    if matrix.ndim != 2 or matrix.shape[1] != n_params:
+        raise ValueError(f"{shape_cls.__name__} needs one row per shape with {n_params} "
+                         f"column(s) ({', '.join(param_names)}), got shape {matrix.shape}.")
+
+    columns = matrix.T
+    if (columns < 0).any(): raise ValueError("Dimensions must be non-negative.")
+
+    surfaces = shape_cls.surface_batch(*columns)
+    if hasattr(shape_cls, "volume_batch"):
+        volumes = shape_cls.volume_batch(*columns)
+    else:
+        volumes = np.zeros_like(surfaces)
+    return surfaces, volumes
 
 ## ----------------------------------------------------
 ## 2. SHAPE MAPPING & PARAMETER DEFINITIONS
@@ -90,14 +172,14 @@ class Tetrahedron(Shape):
 
 SHAPE_MAP = {
     "2D": {
-        "Circle": {"class": Circle, "params": ["Radius"]},
-        "Rectangle": {"class": Rectangle, "params": ["Width", "Height"]},
-        "Triangle": {"class": Triangle, "params": ["Base", "Height"]},
+        "Circle": {"class": Circle, "params": ["Radius"], "dim": "2D"},
+        "Rectangle": {"class": Rectangle, "params": ["Width", "Height"], "dim": "2D"},
+        "Triangle": {"class": Triangle, "params": ["Base", "Height"], "dim": "2D"},
     },
     "3D": {
-        "Block": {"class": Block, "params": ["Length", "Width", "Height"]},
-        "Sphere": {"class": Sphere, "params": ["Radius"]},
-        "Tetrahedron": {"class": Tetrahedron, "params": ["Edge Length"]},
+        "Block": {"class": Block, "params": ["Length", "Width", "Height"], "dim": "3D"},
+        "Sphere": {"class": Sphere, "params": ["Radius"], "dim": "3D"},
+        "Tetrahedron": {"class": Tetrahedron, "params": ["Edge Length"], "dim": "3D"},
     }
 }
 
@@ -105,6 +187,11 @@ SHAPE_MAP = {
 ## 3. TKINTER GUI
 ## ----------------------------------------------------
 
+def _require_filled(val_str):
+    if not val_str:
+        raise ValueError("All fields must be filled.")
+    return val_str
+
 class GeometryApp:
     def __init__(self, master):
         self.master = master
@@ -150,6 +237,8 @@ class GeometryApp:
         self.current_shape_type = tk.StringVar(master, value="")
         self.current_shape_name = tk.StringVar(master, value="")
         self.input_fields = []
+        # SHAPE_MAP entry of the selected shape, looked up once when the shape is chosen
+        self._current_info = None
 
         self.main_frame = ttk.Frame(master, padding="15")
         self.main_frame.pack(fill='both', expand=True)
@@ -210,8 +299,8 @@ class GeometryApp:
                 widget.destroy()
 
         shape_type = self.current_shape_type.get()
-        shape_info = SHAPE_MAP[shape_type][shape_name]
-        params = shape_info["params"]
+        self._current_info = SHAPE_MAP[shape_type][shape_name]
+        params = self._current_info["params"]
 
         input_frame = ttk.LabelFrame(self.dynamic_frame, name='input_frame',
                                      text=f"3. Enter Parameters for {shape_name}", padding="10")
@@ -231,16 +320,10 @@ class GeometryApp:
 
     def _calculate(self):
         try:
-            values = []
-            for entry in self.input_fields:
-                val_str = entry.get().strip()
-                if not val_str:
-                    raise ValueError("All fields must be filled.")
-                values.append(float(val_str))
-
-            shape_type = self.current_shape_type.get()
-            shape_name = self.current_shape_name.get()
-            shape_class = SHAPE_MAP[shape_type][shape_name]["class"]
+            values = [float(_require_filled(entry.get().strip())) for entry in self.input_fields]
+
+            shape_class = self._current_info["class"]
+            shape_type = self._current_info["dim"]
 
             # Instantiate the class with user values
             shape_instance = shape_class(*values)
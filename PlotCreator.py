@@ -1,11 +1,29 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib import style
 import sys # Import sys for clean process exit
-import math # Used for safe eval in PI handling
+import math # Constants and functions allowed in limit expressions
+import ast # Used to parse limit expressions without eval()
+import operator
+from functools import lru_cache
+
+# Matplotlib takes a large share of start-up time to import, so it is loaded by
+# _load_matplotlib() only once the window is already on screen
+plt = None
+FigureCanvasTkAgg = None
+style = None
+
+
+def _load_matplotlib():
+    """Imports the Matplotlib modules used by the plotter into the module namespace."""
+    global plt, FigureCanvasTkAgg, style
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib import style
+
+    # Let Matplotlib drop line vertices that don't change the drawn path by at least a pixel
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
 
 # --- Color Constants for Dark Theme ---
 BG_DARK = '#2C2C2C'      # Main window background
@@ -14,14 +32,34 @@ BG_MID = '#404040'       # Plot/Entry field background
 ACCENT_BLUE = '#00AEEF'  # Accent color for buttons/plot lines
 
 # --- Function Definitions and Mappings ---
+# Values of tan beyond this are hidden, so the line breaks at the asymptotes instead of spiking
+TAN_CLIP = 10
+
+def _clipped_tan(x):
+    """tan(x) with NaN wherever |tan(x)| > TAN_CLIP (next to the asymptotes)."""
+    y = np.tan(x)
+    y[np.abs(y) > TAN_CLIP] = np.nan
+    return y
+
+def _xcos(x):
+    """cos(x) / x computed in a single output array, with NaN at x=0 instead of a division by zero."""
+    out = np.cos(x)
+    is_zero = x == 0
+    np.divide(out, x, out=out, where=~is_zero)
+    out[is_zero] = np.nan
+    return out
+
 FUNCTION_MAP = {
     'sin': np.sin,
     'cos': np.cos,
-    'tan': np.tan,
+    'tan': _clipped_tan,
     # Safe division for xcos, handling division by zero at x=0
-    'xcos': lambda x: np.divide(np.cos(x), x, out=np.full_like(x, np.nan), where=x!=0)
+    'xcos': _xcos
 }
 
+# Legend label and title of each function's plot, built once instead of on every replot
+PLOT_TEXTS = {name: (f'$y = {name}(x)$', f"Plot of $y = {name}(x)$") for name in FUNCTION_MAP}
+
 # Default limits are always stored in RADIANS
 DEFAULT_LIMITS = {
     'sin': (-2 * np.pi, 2 * np.pi),
@@ -30,6 +68,10 @@ DEFAULT_LIMITS = {
     'xcos': (-4 * np.pi, 4 * np.pi)
 }
 
+# Degree equivalents of DEFAULT_LIMITS, converted once at load time for Degrees mode
+DEFAULT_LIMITS_DEG = {name: (math.degrees(lower), math.degrees(upper))
+                      for name, (lower, upper) in DEFAULT_LIMITS.items()}
+
 # --- Matplotlib Dark Theme Customization ---
 # Settings applied using context manager for cleaner plotting logic
 DARK_STYLE = {
@@ -49,6 +91,97 @@ DARK_STYLE = {
 }
 
 
+# --- Safe Limit Expression Parsing ---
+# Only numbers, 'pi', 'e', sqrt(...), unary +/- and + - * / ** are accepted in user-entered limits
+_LIMIT_NAMES = {'pi': math.pi, 'e': math.e}
+_LIMIT_FUNCS = {'sqrt': math.sqrt}
+_LIMIT_BINOPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    # Float power: huge results like 10**10**10 raise OverflowError at once instead of
+    # building an enormous integer
+    ast.Pow: math.pow,
+}
+_LIMIT_UNARYOPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+@lru_cache(maxsize=128)
+def _eval_limit(expr):
+    """Evaluates a limit expression such as '-2*pi' without eval(); cached per unique string."""
+    return _eval_limit_node(ast.parse(expr.lower(), mode='eval').body)
+
+
+def _eval_limit_node(node):
+    """Recursively evaluates a whitelisted AST node of a limit expression."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in _LIMIT_NAMES:
+        return _LIMIT_NAMES[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in _LIMIT_BINOPS:
+        return _LIMIT_BINOPS[type(node.op)](_eval_limit_node(node.left), _eval_limit_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _LIMIT_UNARYOPS:
+        return _LIMIT_UNARYOPS[type(node.op)](_eval_limit_node(node.operand))
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _LIMIT_FUNCS
+            and len(node.args) == 1 and not node.keywords):
+        return _LIMIT_FUNCS[node.func.id](_eval_limit_node(node.args[0]))
+    raise ValueError(f"Unsupported element '{ast.unparse(node)}' in limit expression.")
+
+
+# --- Cached Numeric Core (shared by all plotter instances) ---
+def _linspace_inplace(lower, upper, num_points, dtype):
+    """Returns the np.linspace grid, built by scaling an arange in place (no temporaries)."""
+    out = np.arange(num_points, dtype=dtype)
+    if num_points > 1:
+        out *= (upper - lower) / (num_points - 1)
+        out += lower
+        out[-1] = upper # Exact endpoint, like np.linspace
+    else:
+        out[:] = lower
+    return out
+
+
+@lru_cache(maxsize=8)
+def _get_grid(lower, upper, num_points):
+    """Returns the x grid for the limits, reused when only the function changes."""
+    x = _linspace_inplace(lower, upper, num_points, np.float64)
+    # The arrays are shared between cache hits, so protect them from in-place edits
+    x.flags.writeable = False
+    return x
+
+
+# Factor converting the degree grid to radians for the calculation
+_DEG2RAD = math.pi / 180.0
+
+
+@lru_cache(maxsize=8)
+def _get_radian_grid(lower, upper, num_points):
+    """Returns the radian equivalent of a degree grid, reused when only the function changes."""
+    x_rad = np.multiply(_get_grid(lower, upper, num_points), _DEG2RAD)
+    x_rad.flags.writeable = False
+    return x_rad
+
+
+# The plot can't show more than a few points per horizontal pixel of the axes, so larger
+# requests are evaluated at this density instead (the axes width is taken as at least the minimum)
+POINTS_PER_PIXEL = 4
+MIN_AXES_WIDTH_PX = 100
+
+
+@lru_cache(maxsize=32)
+def _compute_xy(func, lower, upper, num_points, is_degrees):
+    """Returns the read-only (x, y) arrays; x is in the unit of the limits, func gets radians."""
+    x = _get_grid(lower, upper, num_points)
+    # In Radians mode no second array is needed at all
+    y = func(_get_radian_grid(lower, upper, num_points) if is_degrees else x)
+    y.flags.writeable = False
+    return x, y
+
+
 class FunctionPlotterApp:
     """Handles the single-window application with inputs and embedded plot."""
     def __init__(self, master):
@@ -62,13 +195,25 @@ class FunctionPlotterApp:
         self._setup_variables()
         self._setup_ui()
         
-        # Plot default 'sin' function on startup
-        # Initial plot uses the default 1000 points
-        self._update_plot('sin', *DEFAULT_LIMITS['sin'], 1000)
-        
         # --- FIX: Bind window close event to ensure clean exit ---
         self.master.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+        # Import Matplotlib and build the plot once the main loop has started
+        self.master.after(0, self._finish_init)
+
+    def _finish_init(self):
+        """Replaces the loading placeholder with the Matplotlib plot area."""
+        # after(0) runs before the window is mapped; flush map/draw events first so
+        # "Loading plot..." is actually on screen while Matplotlib is imported
+        self.master.update()
+        _load_matplotlib()
+        self.loading_label.destroy()
+        self._create_plot_area(self.plot_frame)
+
+        # Plot default 'sin' function on startup
+        # Initial plot uses the default 1000 points
+        self._update_plot('sin', FUNCTION_MAP['sin'], *DEFAULT_LIMITS['sin'], 1000, False)
+
     def _on_closing(self):
         """Handler for when the user clicks the window's close button."""
         # Cleanly close the Matplotlib figure to release resources
@@ -100,6 +245,9 @@ class FunctionPlotterApp:
         """Initialize control variables."""
         self.unit_var = tk.StringVar(value='Radians')
         self.func_entry = tk.StringVar(value='sin')
+        # The function is resolved whenever the entry is edited, not on every plot
+        self.func_entry.trace_add('write', self._on_func_change)
+        self._on_func_change()
         self.limit_lower = tk.StringVar(value='')
         self.limit_upper = tk.StringVar(value='')
         # New variable for number of points, defaulted to 1000
@@ -108,6 +256,10 @@ class FunctionPlotterApp:
         self.fig = None
         self.ax = None
         self.canvas = None
+        # (func_name, x_label) currently shown, so unchanged texts aren't reset on replot
+        self._shown_labels = None
+        # Axes image without the overlay artists, captured after every full draw for blitting
+        self._background = None
 
     def _create_field(self, label_text, var, row):
         """Helper to create and grid a label/entry pair inside the control frame."""
@@ -154,31 +306,64 @@ class FunctionPlotterApp:
         self.plot_frame = ttk.Frame(self.master, padding="15")
         self.plot_frame.grid(row=0, column=1, sticky='nsew')
         
-        self._create_plot_area(self.plot_frame)
+        # Placeholder shown until _finish_init creates the plot area
+        self.loading_label = ttk.Label(self.plot_frame, text="Loading plot...")
+        self.loading_label.pack(expand=True)
 
     def _create_plot_area(self, master_frame):
         """Initializes the Matplotlib figure and canvas within the plot frame."""
         
-        # Initialize figure and axes using the dark style context
+        # Initialize figure and axes using the dark style context. Every artist takes its
+        # colors when created here, so replots don't need to enter the context again.
         with style.context(DARK_STYLE):
             self.fig, self.ax = plt.subplots(figsize=(8, 6))
 
+            # Persistent artists: _update_plot updates them in place instead of
+            # clearing the axes and rebuilding every artist on each replot
+            self._line, = self.ax.plot([], [], color=ACCENT_BLUE, linewidth=2)
+            zero_lines = (self.ax.axhline(0, color=FG_LIGHT, linewidth=0.8),
+                          self.ax.axvline(0, color=FG_LIGHT, linewidth=0.8))
+            self._legend = self.ax.legend([self._line], [''], loc='upper right')
+            self._legend.set_visible(False)
+
+            # The line and everything drawn above it are animated: full draws skip them
+            # and _on_draw paints them, in their original order, over the background
+            self._overlay = (self._line, *zero_lines, self._legend)
+            for artist in self._overlay:
+                artist.set_animated(True)
+            self.ax.set_ylabel('y', fontsize=12)
+
         self.ax.set_title("Function Plotter: Enter parameters and click 'Plot'", color=FG_LIGHT)
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=master_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.config(bg=BG_DARK)
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Captures the freshly drawn background and paints the overlay artists over it."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._overlay:
+            self.ax.draw_artist(artist)
+
+    def _on_func_change(self, *args):
+        """Resolves the callable for the entered function name (None if it is unknown)."""
+        self._func_name = self.func_entry.get().strip().lower()
+        self._func = FUNCTION_MAP.get(self._func_name)
 
     def _toggle_units(self):
         """Toggles the unit between Radians and Degrees."""
         self.unit_var.set('Degrees' if self.unit_var.get() == 'Radians' else 'Radians')
 
     def _validate_and_plot(self):
-        """Validates input, determines limits in the current unit, and converts them to radians for the plot."""
-        func_name = self.func_entry.get().strip().lower()
-        
-        if func_name not in FUNCTION_MAP:
+        """Validates input, determines limits in the current unit, and passes them to the plot."""
+        if self.canvas is None:
+            return # Plot area is still loading
+
+        # The callable was already resolved by the trace on the function entry
+        func_name, func = self._func_name, self._func
+        if func is None:
             messagebox.showerror("Input Error", "Function unknown. Please use sin, cos, tan, or xcos.")
             return
 
@@ -195,6 +380,10 @@ class FunctionPlotterApp:
                 messagebox.showerror("Input Error", "Number of points must be a positive integer (e.g., 1000).")
                 return
 
+        # Points beyond the axes resolution would cost computation without changing the plot
+        axes_width_px = max(int(self.ax.get_window_extent().width), MIN_AXES_WIDTH_PX)
+        num_points = min(num_points, POINTS_PER_PIXEL * axes_width_px)
+
         # 2. Determine raw limits (lower_val, upper_val) based on user input or unit-aware defaults
         try:
             lower_str = self.limit_lower.get().strip()
@@ -204,26 +393,18 @@ class FunctionPlotterApp:
 
             if lower_str and upper_str:
                 # User specified limits (assumed to be in the currently selected unit)
-                safe_globals = {'pi': math.pi} 
-                # Use eval to handle expressions like '2*pi' in user input
-                lower_val = eval(lower_str.lower().replace('pi', 'math.pi'), safe_globals)
-                upper_val = eval(upper_str.lower().replace('pi', 'math.pi'), safe_globals)
+                # Parse expressions like '2*pi' in user input; float() stays inside the try
+                # because huge integer results (e.g. 10**400) overflow when converted
+                lower_val = float(_eval_limit(lower_str))
+                upper_val = float(_eval_limit(upper_str))
             else:
-                # Use default limits (DEFAULT_LIMITS are in Radians)
-                default_rad_lower, default_rad_upper = DEFAULT_LIMITS[func_name]
-                
-                if is_degrees_mode:
-                    # If in Degrees mode, the raw limit value should be the degree equivalent
-                    # of the default limits for axis display.
-                    lower_val = np.rad2deg(default_rad_lower)
-                    upper_val = np.rad2deg(default_rad_upper)
-                else: # Radians mode
-                    lower_val = default_rad_lower
-                    upper_val = default_rad_upper
+                # Use default limits in the current unit. In Degrees mode the raw limit value
+                # is the precomputed degree equivalent of the (radian) default limits.
+                lower_val, upper_val = DEFAULT_LIMITS_DEG[func_name] if is_degrees_mode else DEFAULT_LIMITS[func_name]
 
             # Basic numerical validation
-            if not isinstance(lower_val, (int, float)) or not isinstance(upper_val, (int, float)):
-                 raise ValueError("Limit expression must resolve to a number.")
+            if not (math.isfinite(lower_val) and math.isfinite(upper_val)):
+                 raise ValueError("Limit expression must resolve to a finite number.")
 
             if lower_val >= upper_val:
                 messagebox.showerror("Input Error", "Lower limit must be less than upper limit.")
@@ -233,59 +414,54 @@ class FunctionPlotterApp:
             messagebox.showerror("Input Error", f"Limits must be valid numbers or expressions (e.g., '2*pi'). Error: {e}")
             return
 
-        # 3. CONVERSION TO RADIANS for calculation (only if in degrees mode)
-        # NumPy functions require radians for plotting.
-        if is_degrees_mode:
-            lower_rad = np.deg2rad(lower_val)
-            upper_rad = np.deg2rad(upper_val)
-        else: # Radians mode
-            lower_rad = lower_val
-            upper_rad = upper_val
-        
-        # 4. Pass the RADIAN limits to the plot
-        self._update_plot(func_name, lower_rad, upper_rad, num_points)
+        # 3. Pass the limits in the CURRENT unit to the plot; the grid is built in display
+        # units and only converted to radians for the calculation.
+        self._update_plot(func_name, func, lower_val, upper_val, num_points, is_degrees_mode)
 
-    def _update_plot(self, func_name, lower, upper, num_points):
+    def _update_plot(self, func_name, func, lower, upper, num_points, is_degrees):
         """Updates the existing Matplotlib plot with new data."""
         
-        # Use the dark style context for consistent plotting elements
-        with style.context(DARK_STYLE):
-            # 1. Clear the previous plot
-            self.ax.clear()
-
-            # 2. Prepare data
-            # x is in RADIANS because it comes from _validate_and_plot as lower_rad/upper_rad
-            x = np.linspace(lower, upper, num_points, endpoint=True)
-            y = FUNCTION_MAP[func_name](x) # Calculation is correct because x is in radians
-
-            # 3. Determine display units
-            is_degrees = self.unit_var.get() == 'Degrees'
-            x_display = np.rad2deg(x) if is_degrees else x # Convert x-values back for display
-            x_label = 'x (degrees)' if is_degrees else 'x (radians)'
-                
-            # 4. Plot new data
-            self.ax.plot(x_display, y, label=f'$y = {func_name}(x)$', color=ACCENT_BLUE, linewidth=2)
-            
-            # 5. Set titles and labels
-            self.ax.set_title(f"Plot of $y = {func_name}(x)$", fontsize=14, fontweight='bold')
-            self.ax.set_xlabel(x_label, fontsize=12)
-            self.ax.set_ylabel('y', fontsize=12)
-            
-            # --- FIX: Clip Y-axis for the tan function to handle asymptotes ---
-            if func_name == 'tan':
-                # Manually set Y limits to hide the massive spikes near the asymptotes
-                self.ax.set_ylim([-10, 10]) 
-            else:
-                # Use automatic scaling for all other functions
-                self.ax.autoscale(enable=True, axis='y')
+        # 1. Prepare data
+        # x_display is in the unit of the limits; y is calculated from its radian equivalent.
+        # Limits are coerced to plain Python numbers so the cache keys are stable
+        x_display, y = _compute_xy(func, float(lower), float(upper), int(num_points), is_degrees)
 
-            # Re-add legend, axes lines
-            self.ax.legend(loc='upper right')
-            self.ax.axhline(0, color=FG_LIGHT, linewidth=0.8)
-            self.ax.axvline(0, color=FG_LIGHT, linewidth=0.8)
+        # 2. Determine display units
+        x_label = 'x (degrees)' if is_degrees else 'x (radians)'
             
-            # 6. Redraw the canvas
-            self.canvas.draw()
+        # 3. Swap the new data into the persistent line
+        self._line.set_data(x_display, y)
+        
+        # 4. Set titles, labels and the legend entry, only when they change
+        # (re-setting a text invalidates its cached layout)
+        texts_changed = self._shown_labels != (func_name, x_label)
+        if texts_changed:
+            label, title = PLOT_TEXTS[func_name]
+            self._line.set_label(label)
+            self._legend.get_texts()[0].set_text(label)
+            self._legend.set_visible(True)
+            self.ax.set_title(title, fontsize=14, fontweight='bold')
+            self.ax.set_xlabel(x_label, fontsize=12)
+            self._shown_labels = (func_name, x_label)
+        
+        # 5. Rescale to the new data (the zero axes lines keep 0 in view, as before).
+        # tan needs no fixed Y limits: its values next to the asymptotes are already NaN.
+        # The grid ends are added explicitly so NaN points don't shrink the X range.
+        old_limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self.ax.relim()
+        self.ax.update_datalim([(x_display[0], 0), (x_display[-1], 0)])
+        self.ax.autoscale_view()
+
+        # 6. If only the line changed, blit it over the cached background. Anything else
+        # invalidates the background, so schedule a full redraw (Tk coalesces pending ones).
+        if self._background is not None and not texts_changed \
+                and old_limits == (self.ax.get_xlim(), self.ax.get_ylim()):
+            self.canvas.restore_region(self._background)
+            for artist in self._overlay:
+                self.ax.draw_artist(artist)
+            self.canvas.blit(self.ax.bbox)
+        else:
+            self.canvas.draw_idle()
 
 
 # --- Main Application Execution ---
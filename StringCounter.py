@@ -2,6 +2,137 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 import re
 
+# Optional accelerators for full recounts, preferred in this order:
+# 1. the _strcount C extension (build with `cythonize -i _strcount.pyx`), any text;
+# 2. Numba (with NumPy), a single compiled pass over ASCII text;
+# 3. the regex based helpers below.
+try:
+    from _strcount import count_all as _scan_text
+except ImportError:
+    _scan_text = None
+
+# NumPy/Numba are only imported when the C extension is missing, so the slow Numba
+# import is skipped whenever it would go unused
+if _scan_text is None:
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        njit = None
+else:
+    njit = None
+
+# --- Precompiled patterns (built once at import instead of on every keystroke) ---
+_LETTERS_RE = re.compile(r'[a-zA-Z]')
+_DIGIT_RE = re.compile(r'\d+')
+# A sentence: some non-whitespace text followed by a terminator (.?!)
+_SENTENCE_RE = re.compile(r'[^.?!\s][^.?!]*[.?!]')
+
+_DIGITS = '0123456789'
+_DIGIT_BYTES = _DIGITS.encode('ascii')
+_LETTER_BYTES = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_TERMINATORS = '.?!'
+
+# --- Update Timing ---
+# Delay after the last key release before the counts are updated
+UPDATE_DELAY_MS = 40
+
+# --- Counting Helpers (all expect an already stripped text) ---
+def _count_letters(text):
+    """Counts only alphabetic characters (a-z and A-Z)."""
+    if text.isascii():
+        # ASCII fast path: one C-level bytes pass deleting the letters, no regex matches
+        data = text.encode('ascii')
+        return len(data) - len(data.translate(None, _LETTER_BYTES))
+    return len(_LETTERS_RE.findall(text))
+
+def _count_numbers(text):
+    """Counts all individual decimal digits, including non-ASCII ones such as '\u0663'."""
+    if text.isascii():
+        # For ASCII text the decimal digits are exactly 0-9
+        data = text.encode('ascii')
+        return len(data) - len(data.translate(None, _DIGIT_BYTES))
+    # One match per run of digits instead of one per digit
+    return sum(map(len, _DIGIT_RE.findall(text)))
+
+def _count_words(text):
+    """Counts whitespace separated tokens that are NOT purely composed of digits."""
+    # Tokens containing mixed characters (e.g., "word123") or decimals (e.g., "1.23") are counted.
+    # Only tokens matching the pattern of one or more digits (e.g., "123", "45") are excluded.
+    return sum(1 for word in text.split() if not _DIGIT_RE.fullmatch(word))
+
+def _count_sentences(text):
+    """Counts sentences, handling multiple dots and non-terminated text."""
+    # Runs of terminators ("...", "?!") close a single sentence because a match must
+    # start with non-whitespace text, and an incomplete final sentence is never counted
+    # because the scan stops at the last terminator. This also keeps the search linear
+    # (no retrying of the pattern over an unterminated tail).
+    end = max(map(text.rfind, _TERMINATORS)) + 1
+    return len(_SENTENCE_RE.findall(text, 0, end))
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_ascii(buf):
+        """Counts (letters, digits, words, sentences) of an ASCII byte array in one pass."""
+        letters = digits = words = sentences = 0
+        in_word = False
+        word_has_non_digit = False
+        sentence_has_content = False
+
+        for i in range(buf.size):
+            c = buf[i]
+
+            # Whitespace (same set as str.split/str.strip for ASCII) ends the current word
+            if c == 32 or 9 <= c <= 13 or 28 <= c <= 31:
+                if in_word and word_has_non_digit:
+                    words += 1
+                in_word = False
+                continue
+
+            if not in_word:
+                in_word = True
+                word_has_non_digit = False
+
+            # In ASCII text the decimal digits (regex \d) are exactly 0-9
+            if 48 <= c <= 57:
+                digits += 1
+            else:
+                word_has_non_digit = True
+                if 65 <= c <= 90 or 97 <= c <= 122:
+                    letters += 1
+                elif c == 46 or c == 63 or c == 33:
+                    # A terminator closes a sentence only if something came before it
+                    if sentence_has_content:
+                        sentences += 1
+                    sentence_has_content = False
+                    continue
+
+            sentence_has_content = True
+
+        if in_word and word_has_non_digit:
+            words += 1
+
+        return letters, digits, words, sentences
+else:
+    _scan_ascii = None
+
+def _count_all(text):
+    """Returns a dict with the Letters, Words, Sentences and Numbers counts of the text."""
+    if _scan_text is not None:
+        letters, digits, words, sentences = _scan_text(text)
+        return {"Letters": letters, "Words": words, "Sentences": sentences, "Numbers": digits}
+
+    if _scan_ascii is not None and text.isascii():
+        letters, digits, words, sentences = _scan_ascii(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+        return {"Letters": letters, "Words": words, "Sentences": sentences, "Numbers": digits}
+
+    return {
+        "Letters": _count_letters(text),
+        "Words": _count_words(text),
+        "Sentences": _count_sentences(text),
+        "Numbers": _count_numbers(text),
+    }
+
 class StringCounterApp:
     def __init__(self, master):
         self.master = master
@@ -55,6 +186,17 @@ class StringCounterApp:
         self.result_text = tk.StringVar(value="Letters Count: 0")
         self.number_count_text = tk.StringVar(value="Numbers Count: 0")
 
+        # Warm up the compiled scanner so the first keystroke isn't blocked by compilation
+        if _scan_text is None and _scan_ascii is not None:
+            _scan_ascii(np.zeros(1, dtype=np.uint8))
+
+        # Id of the scheduled (debounced) update while the user is typing
+        self._pending_update = None
+
+        # Running counts for the (stripped) text last seen, kept up to date incrementally
+        self._last_text = ""
+        self._counts = _count_all(self._last_text)
+
         # --- Layout Setup using Grid ---
         main_frame = ttk.Frame(master)
         main_frame.pack(fill='both', expand=True)
@@ -126,62 +268,72 @@ class StringCounterApp:
     # --- Core Counting Logic ---
     def update_count(self, event=None): 
         """
-        Calculates all counts (Letters, Words, Sentences, and Numbers) 
-        and updates the displays.
+        Brings all counts (Letters, Words, Sentences, and Numbers) up to date
+        and updates the displays. Key releases are debounced so that fast typing
+        triggers a single update once the user pauses.
         """
-        text = self.input_text.get("1.0", tk.END).strip()
+        if self._pending_update is not None:
+            self.master.after_cancel(self._pending_update)
+            self._pending_update = None
+
+        if event is not None:
+            self._pending_update = self.master.after(UPDATE_DELAY_MS, self._do_update)
+        else:
+            # Buttons and radio buttons update immediately
+            self._do_update()
+
+    def _do_update(self):
+        """Recounts the text if it changed and refreshes the result labels."""
+        self._pending_update = None
+
+        # Key releases that did not touch the buffer (arrows, Shift, ...) and
+        # radio button clicks need no rescan, only a refresh of the labels.
+        if self.input_text.edit_modified():
+            self._recount(self.input_text.get("1.0", tk.END).strip())
+            self.input_text.edit_modified(False)
+
         mode = self.count_mode.get()
-        count = 0
-
-        # 1. Number Counting Logic (Counts all individual digits 0-9)
-        number_count = len(re.findall(r'\d', text)) 
-        self.number_count_text.set(f"Numbers Count: {number_count}")
-
-        # 2. Primary Counting Logic
-        if not text:
-            count = 0
-        elif mode == "Letters":
-            # Count only alphabetic characters (a-z and A-Z)
-            count = len(re.findall(r'[a-zA-Z]', text))
-            
-        elif mode == "Words":
-            # Split the text into tokens (words)
-            words = text.split()
-            
-            # Filter tokens: only count as a word if the token is NOT purely composed of digits.
-            # Tokens containing mixed characters (e.g., "word123") or decimals (e.g., "1.23") are counted.
-            # Only tokens matching the pattern of one or more digits (e.g., "123", "45") are excluded.
-            valid_words = [word for word in words if not re.fullmatch(r'\d+', word)]
-            count = len(valid_words)
-            
-        elif mode == "Sentences":
-            # --- FINAL SENTENCE LOGIC: Handles multiple dots and non-terminated text ---
-            
-            # 1. Normalize the text: replace any sequence of two or more dots with a single dot. 
-            text_normalized = re.sub(r'\.{2,}', '.', text)
-            
-            # 2. Split the normalized text based on any single sentence terminator (.?!).
-            sentences = re.split(r'[.?!]', text_normalized)
-            
-            # 3. Count the resulting non-empty segments (the valid sentences).
-            valid_segments = [s.strip() for s in sentences if s.strip()]
-            count = len(valid_segments)
-            
-            # 4. Correct for incomplete final sentence.
-            # Check if the original text ends with a terminator (optionally followed by whitespace).
-            text_ends_with_terminator = bool(re.search(r'[.?!]\s*$', text))
-
-            if count > 0:
-                if not text_ends_with_terminator:
-                    # If the text has segments but does NOT end in punctuation, the last segment is incomplete.
-                    # We subtract 1 to remove the final, un-terminated segment from the count.
-                    count -= 1
-            
-            # Ensure count is not negative
-            count = max(0, count)
+        self._set_if_changed(self.result_text, f"{mode} Count: {self._counts[mode]}")
+        self._set_if_changed(self.number_count_text, f"Numbers Count: {self._counts['Numbers']}")
+
+    def _recount(self, text):
+        """Updates the running counts for the new text, rescanning only the edited tail when possible."""
+        old_text = self._last_text
 
+        if text == old_text:
+            return
+        elif text.startswith(old_text):
+            # Typing at the end (the common case): add what the new tail contributes
+            self._apply_tail(old_text, text, 1)
+        elif old_text.startswith(text):
+            # Deleting from the end: subtract what the removed tail contributed
+            self._apply_tail(text, old_text, -1)
+        else:
+            # Paste, edit in the middle, revert...: fall back to a full recount
+            self._counts = _count_all(text)
 
-        self.result_text.set(f"{mode} Count: {count}")
+        self._last_text = text
+
+    def _apply_tail(self, shorter, longer, sign):
+        """Adds (sign=1) or removes (sign=-1) the contribution of longer's extra tail to the counts."""
+        tail = longer[len(shorter):]
+
+        # Only the last word and the last unfinished sentence of the shorter text can be
+        # extended by the tail, so words and sentences are recounted from their start.
+        word_start = len(shorter) - len(shorter.rsplit(None, 1)[-1]) if shorter else 0
+        sentence_start = max(map(shorter.rfind, _TERMINATORS)) + 1
+
+        counts = self._counts
+        counts["Letters"] += sign * _count_letters(tail)
+        counts["Numbers"] += sign * _count_numbers(tail)
+        counts["Words"] += sign * (_count_words(longer[word_start:]) - _count_words(shorter[word_start:]))
+        counts["Sentences"] += sign * (_count_sentences(longer[sentence_start:]) - _count_sentences(shorter[sentence_start:]))
+
+    @staticmethod
+    def _set_if_changed(var, value):
+        """Sets a StringVar only when its value changes to avoid needless label redraws."""
+        if var.get() != value:
+            var.set(value)
 
     # --- Revert Logic ---
     def revert_string(self):
@@ -189,11 +341,16 @@ class StringCounterApp:
         text = self.input_text.get("1.0", tk.END).strip()
         
         if text:
+            # PEP 393 already stores ASCII text at 1 byte/char, so the slice is the cheapest copy
             reversed_text = text[::-1]
             
-            # Clear the text area and insert the reversed text
-            self.input_text.delete("1.0", tk.END)
-            self.input_text.insert("1.0", reversed_text)
+            # Swap the text area content for the reversed text in a single Tk call
+            self.input_text.replace("1.0", tk.END, reversed_text)
+
+            # Reversing keeps the letter, number and word counts; only sentences must be recounted
+            if text == self._last_text:
+                self._counts["Sentences"] = _count_sentences(reversed_text)
+                self._last_text = reversed_text
             
             # Immediately trigger a count update after the revert
             self.update_count()
@@ -0,0 +1,91 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C implementation of StringCounter's full-text scan.
+
+Build it next to StringCounter.py with:  cythonize -i _strcount.pyx
+StringCounter falls back to its pure Python helpers when it is not built.
+"""
+
+cdef extern from "Python.h":
+    ctypedef unsigned char Py_UCS1
+    ctypedef unsigned short Py_UCS2
+    int PyUnicode_1BYTE_KIND
+    int PyUnicode_2BYTE_KIND
+    int PyUnicode_KIND(object o)
+    void *PyUnicode_DATA(object o)
+    Py_ssize_t PyUnicode_GET_LENGTH(object o)
+    bint Py_UNICODE_ISSPACE(Py_UCS4 ch) nogil
+    bint Py_UNICODE_ISDECIMAL(Py_UCS4 ch) nogil
+
+ctypedef fused char_t:
+    Py_UCS1
+    Py_UCS2
+    Py_UCS4
+
+
+cdef void _scan(const char_t *buf, Py_ssize_t n, Py_ssize_t *counts) noexcept nogil:
+    """Counts letters, digits, words and sentences of a raw PEP 393 buffer in one pass."""
+    cdef Py_ssize_t i
+    cdef Py_ssize_t letters = 0, digits = 0, words = 0, sentences = 0
+    cdef Py_UCS4 c
+    cdef bint in_word = False
+    cdef bint word_has_non_digit = False
+    cdef bint sentence_has_content = False
+
+    for i in range(n):
+        c = buf[i]
+
+        # Whitespace (same rules as str.split/str.strip) ends the current word
+        if Py_UNICODE_ISSPACE(c):
+            if in_word and word_has_non_digit:
+                words += 1
+            in_word = False
+            continue
+
+        if not in_word:
+            in_word = True
+            word_has_non_digit = False
+
+        # Any decimal digit (regex \d) counts as a number, and words made only
+        # of digits are not counted
+        if Py_UNICODE_ISDECIMAL(c):
+            digits += 1
+        else:
+            word_has_non_digit = True
+            if 65 <= c <= 90 or 97 <= c <= 122:
+                letters += 1
+            elif c == 46 or c == 63 or c == 33:
+                # A terminator closes a sentence only if something came before it
+                if sentence_has_content:
+                    sentences += 1
+                sentence_has_content = False
+                continue
+
+        sentence_has_content = True
+
+    if in_word and word_has_non_digit:
+        words += 1
+
+    counts[0] = letters
+    counts[1] = digits
+    counts[2] = words
+    counts[3] = sentences
+
+
+def count_all(str text):
+    """Returns (letters, digits, words, sentences) of an already stripped text."""
+    cdef Py_ssize_t counts[4]
+    cdef Py_ssize_t n = PyUnicode_GET_LENGTH(text)
+    cdef int kind = PyUnicode_KIND(text)
+    cdef void *data = PyUnicode_DATA(text)
+
+    # Scan the string's own buffer in place, without copying or holding the GIL
+    with nogil:
+        if kind == PyUnicode_1BYTE_KIND:
+            _scan(<const Py_UCS1 *> data, n, counts)
+        elif kind == PyUnicode_2BYTE_KIND:
+            _scan(<const Py_UCS2 *> data, n, counts)
+        else:
+            _scan(<const Py_UCS4 *> data, n, counts)
+
+    return counts[0], counts[1], counts[2], counts[3]